@@ -4,13 +4,213 @@ File Integrity Checker
 A comprehensive tool for detecting file tampering through hash comparison.
 """
 
+import functools
 import hashlib
 import json
 import os
+import stat
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+CHUNK_SIZE = 1024 * 1024
+VERIFY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Read-ahead requested for a file before its turn comes. Kept small so that
+# every worker prefetching a multi-GB file cannot evict the data being hashed.
+PREFETCH_SIZE = 4 * 1024 * 1024
+# Databases at least this large are stream-parsed with ijson when it is
+# installed, so the raw JSON text is never held alongside the parsed objects.
+STREAM_PARSE_THRESHOLD = 64 * 1024 * 1024
+
+# Files whose mtime or ctime is this close to the moment they were hashed get
+# no size/mtime fingerprint: on filesystems with coarse timestamps (FAT: 2 s) a
+# write in the same tick would leave them unchanged. Git's "racy" rule.
+RACY_WINDOW_NS = 2 * 10**9
+
+# (state, current_hash, stat) produced by the read-only half of verification.
+# stat is None when it is not safe to record as a fingerprint.
+VerifyOutcome = Tuple[str, Optional[str], Optional[os.stat_result]]
+
+# (hexdigest, first-block fingerprint, stat taken before hashing, whether that
+# stat is a safe fingerprint). hexdigest is None when the first block did not
+# match the expected fingerprint and the full hash was skipped.
+ScanResult = Tuple[Optional[str], str, os.stat_result, bool]
+
+# Named constructors dispatch straight to the OpenSSL EVP implementation,
+# which selects SHA-NI on CPUs that have it (Ice Lake+, Zen+). Anything not
+# listed here is still accepted through hashlib.new().
+HASH_CONSTRUCTORS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "blake2b": hashlib.blake2b,
+}
+if blake3 is not None:
+    HASH_CONSTRUCTORS["blake3"] = blake3.blake3
+
+# Variable-length digests (SHAKE) need a length for hexdigest() and are rejected.
+SUPPORTED_ALGORITHMS = frozenset(HASH_CONSTRUCTORS) | frozenset(
+    name for name in hashlib.algorithms_available if not name.lower().startswith("shake")
+)
+
+# A cheap fingerprint of the first block, stored next to the full hash. A
+# mismatch on verify proves tampering without reading the rest of the file.
+HEAD_SIZE = 4096
+if xxhash is not None:
+    HEAD_ALGORITHM = "xxh3_64"
+    _head_constructor = xxhash.xxh3_64
+else:
+    HEAD_ALGORITHM = "blake2b-64"
+    _head_constructor = functools.partial(hashlib.blake2b, digest_size=8)
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_database_file(path) -> Dict:
+    """Read a database file.
+    
+    Files of STREAM_PARSE_THRESHOLD or more are built in a single ijson pass
+    when ijson is installed, without reading the raw text into memory first.
+    Smaller files, or any file without ijson, are read whole and parsed with
+    orjson or the stdlib parser, which is faster when the text fits easily.
+    """
+    with open(path, 'rb') as f:
+        if ijson is not None and os.fstat(f.fileno()).st_size >= STREAM_PARSE_THRESHOLD:
+            return dict(ijson.kvitems(f, "", use_float=True))
+        return _loads(f.read())
+
+
+def _advise_fd(fd: int, advice: str, length: int = 0) -> None:
+    """Pass a posix_fadvise hint for the first length bytes (0: whole file), where supported."""
+    if hasattr(os, "posix_fadvise") and hasattr(os, advice):
+        try:
+            os.posix_fadvise(fd, 0, length, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _hash_readinto(f, hash_obj) -> None:
+    """Feed an open binary file to hash_obj through one reusable buffer."""
+    buf = bytearray(CHUNK_SIZE)
+    update = hash_obj.update
+    with memoryview(buf) as view:
+        while True:
+            size = f.readinto(buf)
+            if not size:
+                break
+            update(view[:size])
+
+
+def prefetch_file(file_path: str) -> None:
+    """Start reading the first PREFETCH_SIZE bytes of a file into the page cache."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        _advise_fd(fd, "POSIX_FADV_WILLNEED", PREFETCH_SIZE)
+    finally:
+        os.close(fd)
+
+
+def _hash_open_file(f, new_hash: Callable, prefix: bytes = b""):
+    """Hash an open binary file from its start and return the hash object.
+    
+    prefix holds bytes already read from the start of f; reading resumes after it.
+    Files are always read rather than memory-mapped: a file truncated while a
+    mapping is being hashed raises SIGBUS, which would kill the whole process.
+    """
+    _advise_fd(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+    if prefix:
+        hash_obj = new_hash()
+        hash_obj.update(prefix)
+        _hash_readinto(f, hash_obj)
+        return hash_obj
+    if sys.version_info >= (3, 11):
+        # file_digest reads into a reusable buffer instead of
+        # allocating a new bytes object per chunk.
+        return hashlib.file_digest(f, new_hash)
+    hash_obj = new_hash()
+    _hash_readinto(f, hash_obj)
+    return hash_obj
+
+
+def _stat_key(file_stat: os.stat_result) -> Tuple[int, int, int]:
+    """Return the (size, mtime_ns, ctime_ns) triple used as a fast-path fingerprint."""
+    return file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns
+
+
+def _scan_file(file_path: str, algorithm: str, expected_head: Optional[str] = None) -> ScanResult:
+    """Hash a file and fingerprint its first block in one pass over one descriptor.
+    
+    If expected_head is given and the first block of a file longer than one
+    block does not match it, the full hash is skipped. Both stats are taken on
+    the descriptor being hashed; the stat is only a safe fingerprint if nothing
+    changed while hashing and the file's timestamps are older than
+    RACY_WINDOW_NS.
+    """
+    new_hash = _hasher_for(algorithm)
+    with open(file_path, 'rb') as f:
+        before = os.fstat(f.fileno())
+        head = f.read(HEAD_SIZE)
+        head_hash = _head_constructor(head).hexdigest()
+        if expected_head is not None and before.st_size > HEAD_SIZE and head_hash != expected_head:
+            return None, head_hash, before, False
+        digest = _hash_open_file(f, new_hash, head).hexdigest()
+        after = os.fstat(f.fileno())
+    newest = max(after.st_mtime_ns, after.st_ctime_ns)
+    stable = _stat_key(before) == _stat_key(after) and time.time_ns() - newest >= RACY_WINDOW_NS
+    return digest, head_hash, before, stable
+
+
+@functools.lru_cache(maxsize=None)
+def _hasher_for(algorithm: str) -> Callable:
+    """Return a zero-argument constructor for the given algorithm name."""
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"unsupported hash algorithm: {algorithm}")
+    constructor = HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is not None:
+        return constructor
+    return functools.partial(hashlib.new, algorithm)
 
 
 class FileIntegrityChecker:
@@ -20,114 +220,329 @@ class FileIntegrityChecker:
         """Initialize the checker with a database file."""
         self.database_path = Path(database_path)
         self.database = self._load_database()
+        # Bulk operations set _defer_save and flush once at the end.
+        self._defer_save = False
+        self._save_needed = False
+        # Fixed timestamp shared by every record touched in one bulk operation.
+        self._now_iso: Optional[str] = None
     
     def _load_database(self) -> Dict:
         """Load the integrity database from file."""
         if self.database_path.exists():
             try:
-                with open(self.database_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                return _read_database_file(self.database_path)
+            except JSON_ERRORS + (IOError,) as e:
                 print(f"Warning: Could not load database: {e}")
                 return {"files": {}, "metadata": {"created": datetime.now().isoformat()}}
         return {"files": {}, "metadata": {"created": datetime.now().isoformat()}}
     
+    def _now(self) -> str:
+        """Return the current timestamp, or the one pinned for a bulk operation."""
+        if self._now_iso is not None:
+            return self._now_iso
+        return datetime.now().isoformat()
+    
     def _save_database(self) -> bool:
-        """Save the integrity database to file."""
+        """Save the integrity database to file.
+        
+        The database is written and fsynced to a temporary file, then moved into
+        place, so a crash never leaves a truncated database behind. A symlinked
+        database path is followed so the link target is the file replaced, and
+        the existing file's mode and owner carry over to the new one.
+        """
+        if self._defer_save:
+            self._save_needed = True
+            return True
+        self._save_needed = False
+        target_path = Path(os.path.realpath(self.database_path))
+        tmp_path = target_path.with_suffix(target_path.suffix + ".tmp")
         try:
-            self.database["metadata"]["last_updated"] = datetime.now().isoformat()
-            with open(self.database_path, 'w', encoding='utf-8') as f:
-                json.dump(self.database, f, indent=2, ensure_ascii=False)
+            self.database["metadata"]["last_updated"] = self._now()
+            with open(tmp_path, 'wb') as f:
+                self._copy_permissions(target_path, tmp_path)
+                f.write(_dumps(self.database))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, target_path)
             return True
         except IOError as e:
             print(f"Error saving database: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             return False
     
+    @staticmethod
+    def _copy_permissions(source: Path, dest: Path) -> None:
+        """Give dest the mode, and where permitted the owner, of source if it exists."""
+        try:
+            source_stat = os.stat(source)
+        except FileNotFoundError:
+            return
+        os.chmod(dest, stat.S_IMODE(source_stat.st_mode))
+        if hasattr(os, "chown"):
+            try:
+                os.chown(dest, source_stat.st_uid, source_stat.st_gid)
+            except PermissionError:
+                pass
+    
     @staticmethod
     def calculate_file_hash(file_path: str, algorithm: str = "sha256") -> Optional[str]:
         """Calculate hash of a file using specified algorithm."""
         try:
-            hash_obj = hashlib.new(algorithm)
+            new_hash = _hasher_for(algorithm)
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(chunk)
-            return hash_obj.hexdigest()
+                return _hash_open_file(f, new_hash).hexdigest()
+        except (IOError, ValueError) as e:
+            print(f"Error calculating hash for {file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _scan(file_path: str, algorithm: str, expected_head: Optional[str] = None) -> Optional[ScanResult]:
+        """Hash a file for recording, reporting errors like calculate_file_hash."""
+        try:
+            return _scan_file(file_path, algorithm, expected_head)
         except (IOError, ValueError) as e:
             print(f"Error calculating hash for {file_path}: {e}")
             return None
     
-    def add_file(self, file_path: str, description: str = "") -> bool:
+    def add_file(self, file_path: str, description: str = "", algorithm: str = "sha256") -> bool:
         """Add a file to the integrity database."""
         file_path = os.path.abspath(file_path)
         
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            print(f"Error: Unsupported hash algorithm {algorithm}")
+            return False
+        
         if not os.path.exists(file_path):
             print(f"Error: File {file_path} does not exist")
             return False
         
-        hash_value = self.calculate_file_hash(file_path)
-        if hash_value is None:
+        scan = self._scan(file_path, algorithm)
+        if scan is None:
             return False
         
-        file_stat = os.stat(file_path)
+        self._store_file_info(file_path, scan, description, algorithm)
+        return self._save_database()
+    
+    def add_files_bulk(self, file_paths: List[str], description: str = "",
+                       algorithm: str = "sha256") -> Dict[str, bool]:
+        """Add many files at once, hashing them in parallel and saving the database once."""
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            print(f"Error: Unsupported hash algorithm {algorithm}")
+            return {os.path.abspath(file_path): False for file_path in file_paths}
+        
+        # Same result as os.path.abspath, but with getcwd() called once per batch.
+        cwd = os.getcwd()
+        file_paths = [os.path.normpath(os.path.join(cwd, file_path)) for file_path in file_paths]
+        
+        def scan_existing(file_path: str) -> Optional[ScanResult]:
+            if not os.path.exists(file_path):
+                return None
+            return self._scan(file_path, algorithm)
+        
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            scans = list(executor.map(scan_existing, file_paths))
+        
+        results = {}
+        self._now_iso = datetime.now().isoformat()
+        try:
+            for file_path, scan in zip(file_paths, scans):
+                if scan is None:
+                    if not os.path.exists(file_path):
+                        print(f"Error: File {file_path} does not exist")
+                    results[file_path] = False
+                    continue
+                self._store_file_info(file_path, scan, description, algorithm)
+                results[file_path] = True
+            
+            if any(results.values()) and not self._save_database():
+                return {file_path: False for file_path in results}
+        finally:
+            self._now_iso = None
+        return results
+    
+    def _store_file_info(self, file_path: str, scan: ScanResult, description: str, algorithm: str) -> None:
+        """Record a freshly hashed file in the in-memory database."""
+        hash_value, head_hash, file_stat, stable = scan
+        now = self._now()
         file_info = {
             "hash": hash_value,
-            "algorithm": "sha256",
+            "algorithm": algorithm,
             "size": file_stat.st_size,
-            "added_date": datetime.now().isoformat(),
-            "last_checked": datetime.now().isoformat(),
+            "added_date": now,
+            "last_checked": now,
             "description": description,
             "check_count": 1,
             "status": "verified"
         }
+        if stable:
+            file_info["mtime_ns"] = file_stat.st_mtime_ns
+            file_info["ctime_ns"] = file_stat.st_ctime_ns
+        file_info["head_hash"] = head_hash
+        file_info["head_algorithm"] = HEAD_ALGORITHM
         
         self.database["files"][file_path] = file_info
-        return self._save_database()
     
-    def verify_file(self, file_path: str) -> Tuple[str, Dict]:
-        """Verify a file's integrity against stored hash."""
-        file_path = os.path.abspath(file_path)
+    def verify_file(self, file_path: str, paranoid: bool = False, *,
+                    update_stats: bool = True) -> Tuple[str, Dict]:
+        """Verify a file's integrity against stored hash.
         
+        Unless paranoid is set, a file whose size, mtime and ctime all match the
+        values recorded at its last successful hash is reported as verified
+        without being read again. With update_stats=False the database is left
+        untouched.
+        """
+        file_path = os.path.abspath(file_path)
+        outcome = self._compute_hash_readonly(file_path, paranoid)
+        return self._record_verification(file_path, outcome, update_stats)
+    
+    def _compute_hash_readonly(self, file_path: str, paranoid: bool = False) -> VerifyOutcome:
+        """Hash a tracked file without touching the database; safe to run in worker threads."""
         if file_path not in self.database["files"]:
-            return "unknown", {"message": "File not in database"}
-        
-        if not os.path.exists(file_path):
-            return "missing", {"message": "File no longer exists"}
+            return "unknown", None, None
         
         stored_info = self.database["files"][file_path]
-        current_hash = self.calculate_file_hash(file_path, stored_info.get("algorithm", "sha256"))
+        fingerprint = None if paranoid else self._stat_fingerprint(stored_info)
+        return self._hash_tracked_file(file_path, stored_info.get("algorithm", "sha256"), fingerprint,
+                                       self._stored_head_hash(stored_info))
+    
+    @staticmethod
+    def _stat_fingerprint(stored_info: Dict) -> Optional[Tuple[int, int, int]]:
+        """Return the (size, mtime_ns, ctime_ns) recorded for a verified file, if any."""
+        if stored_info.get("status") != "verified" or "mtime_ns" not in stored_info:
+            return None
+        return stored_info["size"], stored_info["mtime_ns"], stored_info.get("ctime_ns")
+    
+    @staticmethod
+    def _stored_head_hash(stored_info: Dict) -> Optional[str]:
+        """Return the stored first-block fingerprint if it can be compared with HEAD_ALGORITHM."""
+        if stored_info.get("head_algorithm") != HEAD_ALGORITHM:
+            return None
+        return stored_info.get("head_hash")
+    
+    def _hash_tracked_file(self, file_path: str, algorithm: str,
+                           fingerprint: Optional[Tuple[int, int, int]] = None,
+                           head_hash: Optional[str] = None) -> VerifyOutcome:
+        """Hash a file whose algorithm is already known, without reading the database."""
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return "missing", None, None
+        
+        if fingerprint == _stat_key(file_stat):
+            return "unchanged", None, file_stat
         
+        scan = self._scan(file_path, algorithm, head_hash)
+        if scan is None:
+            return "error", None, None
+        current_hash, _, file_stat, stable = scan
         if current_hash is None:
+            return "head_mismatch", None, file_stat
+        return "hashed", current_hash, file_stat if stable else None
+    
+    def _record_verification(self, file_path: str, outcome: VerifyOutcome,
+                             update_stats: bool = True) -> Tuple[str, Dict]:
+        """Apply a computed hash to the database and build the verification result.
+        
+        With update_stats=False the result is built without touching the entry,
+        so a read-only check never causes a database write.
+        """
+        state, current_hash, file_stat = outcome
+        if state == "unknown":
+            return "unknown", {"message": "File not in database"}
+        if state == "missing":
+            return "missing", {"message": "File no longer exists"}
+        if state == "error":
             return "error", {"message": "Could not calculate current hash"}
         
-        # Update check information
-        self.database["files"][file_path]["last_checked"] = datetime.now().isoformat()
-        self.database["files"][file_path]["check_count"] = stored_info.get("check_count", 0) + 1
+        entry = self.database["files"][file_path]
+        now = self._now()
+        
+        if update_stats:
+            # Update check information
+            entry["last_checked"] = now
+            entry["check_count"] = entry.get("check_count", 0) + 1
+        
+        if state == "unchanged":
+            if update_stats:
+                self._save_database()
+            return "verified", {
+                "message": "File integrity verified (size and timestamps unchanged)",
+                "hash": entry["hash"],
+                "last_checked": now
+            }
         
-        if current_hash == stored_info["hash"]:
-            self.database["files"][file_path]["status"] = "verified"
-            self._save_database()
+        if current_hash == entry["hash"]:
+            if update_stats:
+                entry["status"] = "verified"
+                if file_stat is not None:
+                    entry["size"] = file_stat.st_size
+                    entry["mtime_ns"] = file_stat.st_mtime_ns
+                    entry["ctime_ns"] = file_stat.st_ctime_ns
+                else:
+                    entry.pop("mtime_ns", None)
+                    entry.pop("ctime_ns", None)
+                self._save_database()
             return "verified", {
                 "message": "File integrity verified",
                 "hash": current_hash,
-                "last_checked": self.database["files"][file_path]["last_checked"]
+                "last_checked": now
             }
         else:
-            self.database["files"][file_path]["status"] = "tampered"
-            self.database["files"][file_path]["tampered_date"] = datetime.now().isoformat()
-            self._save_database()
+            if update_stats:
+                entry["status"] = "tampered"
+                entry["tampered_date"] = now
+                self._save_database()
+            message = "File has been modified"
+            if state == "head_mismatch":
+                message += " (first block differs; full hash skipped)"
             return "tampered", {
-                "message": "File has been modified",
-                "expected_hash": stored_info["hash"],
+                "message": message,
+                "expected_hash": entry["hash"],
                 "current_hash": current_hash,
-                "tampered_date": self.database["files"][file_path]["tampered_date"]
+                "tampered_date": now
             }
     
-    def verify_all_files(self) -> Dict[str, Dict]:
+    def verify_all_files(self, paranoid: bool = False, *, update_stats: bool = True) -> Dict[str, Dict]:
         """Verify all files in the database."""
+        # Hashing releases the GIL, so worker threads overlap disk reads and
+        # hash computation; database updates are applied here, one at a time.
+        # Snapshot paths and algorithms into parallel lists up front so the
+        # workers never look anything up in the shared database dict.
+        tracked = self.database["files"]
+        file_paths = list(tracked)
+        algorithms = [info.get("algorithm", "sha256") for info in tracked.values()]
+        fingerprints = [None if paranoid else self._stat_fingerprint(info) for info in tracked.values()]
+        head_hashes = [self._stored_head_hash(info) for info in tracked.values()]
+        
+        def hash_and_prefetch(index: int) -> VerifyOutcome:
+            # Each worker hints the file it is likely to pick up next, so the
+            # kernel ramps read-ahead while the current file is hashed.
+            ahead = index + VERIFY_WORKERS
+            if ahead < len(file_paths) and fingerprints[ahead] is None:
+                prefetch_file(file_paths[ahead])
+            return self._hash_tracked_file(file_paths[index], algorithms[index], fingerprints[index],
+                                           head_hashes[index])
+        
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            outcomes = list(executor.map(hash_and_prefetch, range(len(file_paths))))
+        
         results = {}
-        for file_path in self.database["files"]:
-            status, info = self.verify_file(file_path)
-            results[file_path] = {"status": status, "info": info}
+        self._now_iso = datetime.now().isoformat()
+        try:
+            self._defer_save = True
+            try:
+                for file_path, outcome in zip(file_paths, outcomes):
+                    status, info = self._record_verification(file_path, outcome, update_stats)
+                    results[file_path] = {"status": status, "info": info}
+            finally:
+                self._defer_save = False
+            if self._save_needed:
+                self._save_database()
+        finally:
+            self._now_iso = None
         return results
     
     def remove_file(self, file_path: str) -> bool:
@@ -157,8 +572,8 @@ class FileIntegrityChecker:
     def export_database(self, export_path: str) -> bool:
         """Export the database to a specified file."""
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.database, f, indent=2, ensure_ascii=False)
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(self.database, pretty=True))
             return True
         except IOError as e:
             print(f"Error exporting database: {e}")
@@ -167,8 +582,7 @@ class FileIntegrityChecker:
     def import_database(self, import_path: str, merge: bool = False) -> bool:
         """Import a database from a specified file."""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            imported_data = _read_database_file(import_path)
             
             if merge:
                 self.database["files"].update(imported_data.get("files", {}))
@@ -176,58 +590,116 @@ class FileIntegrityChecker:
                 self.database = imported_data
             
             return self._save_database()
-        except (json.JSONDecodeError, IOError) as e:
+        except JSON_ERRORS + (IOError,) as e:
             print(f"Error importing database: {e}")
             return False
 
 
+# Option name -> whether it takes a value (--name=value) or is a bare flag.
+CLI_OPTIONS = {"algorithm": True, "paranoid": False, "readonly": False}
+COMMAND_OPTIONS = {
+    "add": ("algorithm",),
+    "add-many": ("algorithm",),
+    "verify": ("paranoid", "readonly"),
+    "verify-all": ("paranoid", "readonly"),
+}
+
+
 def main():
     """Main CLI interface for the File Integrity Checker."""
-    if len(sys.argv) < 2:
+    options = {}
+    args = [sys.argv[0]]
+    end_of_options = False
+    for arg in sys.argv[1:]:
+        if end_of_options or not arg.startswith("--"):
+            args.append(arg)
+        elif arg == "--":
+            end_of_options = True
+        else:
+            name, sep, value = arg[2:].partition("=")
+            if name not in CLI_OPTIONS:
+                print(f"Error: Unknown option {arg}")
+                return
+            if CLI_OPTIONS[name] and not value:
+                print(f"Error: Option --{name} requires a value (--{name}=VALUE)")
+                return
+            if not CLI_OPTIONS[name] and sep:
+                print(f"Error: Option --{name} does not take a value")
+                return
+            options[name] = value
+    
+    if len(args) < 2:
         print("File Integrity Checker")
         print("Usage:")
-        print("  python file_integrity_checker.py add <file_path> [description]")
-        print("  python file_integrity_checker.py verify <file_path>")
-        print("  python file_integrity_checker.py verify-all")
+        print("  python file_integrity_checker.py add <file_path> [description] [--algorithm=sha256|sha1|blake2b|blake3]")
+        print("  python file_integrity_checker.py add-many <file_path> [file_path ...] [--algorithm=...]")
+        print("  python file_integrity_checker.py verify <file_path> [--paranoid] [--readonly]")
+        print("  python file_integrity_checker.py verify-all [--paranoid] [--readonly]")
         print("  python file_integrity_checker.py list")
         print("  python file_integrity_checker.py remove <file_path>")
         print("  python file_integrity_checker.py export <export_path>")
         print("  python file_integrity_checker.py import <import_path> [merge]")
+        print()
+        print("  --paranoid    always rehash, even when size and timestamps are unchanged")
+        print("  --readonly    report results without updating the database")
+        print("  --            treat every following argument as a path")
         return
     
+    command = args[1].lower()
+    for name in options:
+        if name not in COMMAND_OPTIONS.get(command, ()):
+            print(f"Error: Option --{name} does not apply to {command}")
+            return
+    
     checker = FileIntegrityChecker()
-    command = sys.argv[1].lower()
     
     if command == "add":
-        if len(sys.argv) < 3:
+        if len(args) < 3:
             print("Error: Please specify a file path")
             return
-        file_path = sys.argv[2]
-        description = sys.argv[3] if len(sys.argv) > 3 else ""
-        if checker.add_file(file_path, description):
+        file_path = args[2]
+        description = args[3] if len(args) > 3 else ""
+        algorithm = options.get("algorithm", "sha256")
+        if checker.add_file(file_path, description, algorithm):
             print(f"✓ Added {file_path} to integrity database")
         else:
             print(f"✗ Failed to add {file_path}")
     
+    elif command == "add-many":
+        if len(args) < 3:
+            print("Error: Please specify at least one file path")
+            return
+        algorithm = options.get("algorithm", "sha256")
+        results = checker.add_files_bulk(args[2:], algorithm=algorithm)
+        added = sum(1 for ok in results.values() if ok)
+        print(f"✓ Added {added} of {len(results)} files to integrity database")
+        for file_path, ok in results.items():
+            if not ok:
+                print(f"  ✗ Failed to add {file_path}")
+    
     elif command == "verify":
-        if len(sys.argv) < 3:
+        if len(args) < 3:
             print("Error: Please specify a file path")
             return
-        file_path = sys.argv[2]
-        status, info = checker.verify_file(file_path)
+        file_path = args[2]
+        status, info = checker.verify_file(file_path, paranoid="paranoid" in options,
+                                           update_stats="readonly" not in options)
         if status == "verified":
             print(f"✓ {file_path}: {info['message']}")
         elif status == "tampered":
             print(f"⚠ {file_path}: {info['message']}")
             print(f"  Expected: {info['expected_hash']}")
-            print(f"  Current:  {info['current_hash']}")
+            if info["current_hash"] is not None:
+                print(f"  Current:  {info['current_hash']}")
         else:
             print(f"✗ {file_path}: {info['message']}")
     
     elif command == "verify-all":
-        results = checker.verify_all_files()
-        verified = sum(1 for r in results.values() if r["status"] == "verified")
-        tampered = sum(1 for r in results.values() if r["status"] == "tampered")
+        results = checker.verify_all_files(paranoid="paranoid" in options,
+                                           update_stats="readonly" not in options)
+        counts = Counter(r["status"] for r in results.values())
+        verified = counts["verified"]
+        tampered = counts["tampered"]
         errors = len(results) - verified - tampered
         
         print(f"Verification Results:")
@@ -252,31 +724,31 @@ def main():
             print(f"{status_symbol:<10} {file_info['path']:<50} {file_info['size']:<10} {file_info['check_count']:<8}")
     
     elif command == "remove":
-        if len(sys.argv) < 3:
+        if len(args) < 3:
             print("Error: Please specify a file path")
             return
-        file_path = sys.argv[2]
+        file_path = args[2]
         if checker.remove_file(file_path):
             print(f"✓ Removed {file_path} from database")
         else:
             print(f"✗ File {file_path} not found in database")
     
     elif command == "export":
-        if len(sys.argv) < 3:
+        if len(args) < 3:
             print("Error: Please specify export path")
             return
-        export_path = sys.argv[2]
+        export_path = args[2]
         if checker.export_database(export_path):
             print(f"✓ Database exported to {export_path}")
         else:
             print(f"✗ Failed to export database")
     
     elif command == "import":
-        if len(sys.argv) < 3:
+        if len(args) < 3:
             print("Error: Please specify import path")
             return
-        import_path = sys.argv[2]
-        merge = len(sys.argv) > 3 and sys.argv[3].lower() == "merge"
+        import_path = args[2]
+        merge = len(args) > 3 and args[3].lower() == "merge"
         if checker.import_database(import_path, merge):
             action = "merged" if merge else "imported"
             print(f"✓ Database {action} from {import_path}")